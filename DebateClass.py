@@ -3,29 +3,188 @@
 Enhanced Society Debate System with memory, benchmarking, and modularity
 """
 
+import asyncio
+import hashlib
+import httpx
 import json
+import numpy as np
 import ollama
+import orjson
+import re
+import sqlite3
 import time
+from collections import Counter
 from datetime import datetime
 from itertools import combinations
 from pathlib import Path
-from typing import List, Dict, Optional
-from tqdm import tqdm
+from typing import Iterable, List, Dict, Optional, Tuple
+from tqdm.asyncio import tqdm_asyncio
+
+# Prompt templates, filled with str.format
+SYSTEM_TEMPLATE = "You are a member of a round table discussing {label}. Your stance is: {position}."
+
+REBUTTAL_TEMPLATE = """Your opponent's {label} is:
+{position}
+
+Point out specific weaknesses, contradictions, or problems with their {label}.
+Be analytical and precise. Keep response under 150 words."""
+
+COUNTER_TEMPLATE = """Your opponent criticized your {label} by saying:
+{rebuttal}
+
+Address their criticisms directly and explain why your {label} still holds.
+Keep response under 150 words."""
+
+JUDGE_SYSTEM_TEMPLATE = """You will judge a series of debates about {label}s.
+Each debate shows two initial positions, A and B, followed by their criticisms and defenses.
+Based on the strength of arguments and rebuttals, decide which {label} is more convincing.
+Reply with only 'A' or 'B' and one sentence explaining why."""
+
+DEBATE_SUMMARY_TEMPLATE = """=== Initial Positions ===
+Position A ({id_a}): {position_a}
+
+Position B ({id_b}): {position_b}
+
+=== Debate ===
+A's criticism of B: {rebuttal_a}
+
+B's criticism of A: {rebuttal_b}
+
+A's defense: {counter_a}
+
+B's defense: {counter_b}"""
+
+# Small quantized model for the A/B judging in Phase 3 (pass as voter_model)
+FAST_JUDGE_MODEL = "llama3.2:1b-instruct-q4_K_M"
+
+# First standalone A/B token, so "Absolutely B" is a vote for B
+_VOTE_RE = re.compile(r"\b([AB])\b")
+
+
+def parse_vote(vote_response: str) -> str:
+    """Extract 'A' or 'B' from a voter's reply, defaulting to 'B'"""
+    match = _VOTE_RE.search(vote_response)
+    return match.group(1) if match else "B"
+
+
+def parse_votes(vote_responses: Iterable[str]) -> np.ndarray:
+    """Parse a batch of replies at once, e.g. to re-score a saved votes.json"""
+    return np.fromiter((parse_vote(r) for r in vote_responses), dtype="U1")
+
+
+class LLMCache:
+    """On-disk response cache keyed by model, messages and sampling options"""
+    
+    def __init__(self, path: Path):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _key(model: str, messages: List[Dict], options: Optional[Dict]) -> str:
+        """Hash the full request so any change to it is a cache miss"""
+        payload = json.dumps({"m": model, "msgs": messages, "opts": options}, sort_keys=True)
+        return hashlib.blake2b(payload.encode()).hexdigest()
+    
+    def get(self, model: str, messages: List[Dict], options: Optional[Dict] = None) -> Optional[str]:
+        """Return the cached response, or None on a miss"""
+        row = self._conn.execute(
+            "SELECT response FROM responses WHERE key = ?",
+            (self._key(model, messages, options),)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, model: str, messages: List[Dict], response: str, options: Optional[Dict] = None):
+        """Store a response"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+            (self._key(model, messages, options), response)
+        )
+        self._conn.commit()
+
+
+class SemanticCache:
+    """In-memory nearest-neighbour cache over prompt embeddings, one index per namespace"""
+    
+    def __init__(self, client: ollama.AsyncClient,
+                 embedding_model: str = "nomic-embed-text",
+                 threshold: float = 0.95):
+        self._client = client
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self._vectors = {}    # namespace -> unit-normalised embeddings, one row per response
+        self._responses = {}  # namespace -> responses, parallel to the rows above
+    
+    async def _embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt as a unit vector"""
+        response = await self._client.embeddings(model=self.embedding_model, prompt=prompt)
+        vector = np.asarray(response["embedding"], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+    
+    async def lookup(self, namespace: str, prompt: str) -> Tuple[Optional[str], np.ndarray]:
+        """Return the closest cached response above threshold (or None) and the query vector"""
+        query = await self._embed(prompt)
+        vectors = self._vectors.get(namespace)
+        if vectors is not None:
+            similarities = vectors @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] > self.threshold:
+                return self._responses[namespace][best], query
+        return None, query
+    
+    def add(self, namespace: str, query: np.ndarray, response: str):
+        """Store a response under its query vector"""
+        vectors = self._vectors.get(namespace)
+        if vectors is None:
+            self._vectors[namespace] = query[np.newaxis, :]
+            self._responses[namespace] = []
+        else:
+            self._vectors[namespace] = np.vstack([vectors, query])
+        self._responses[namespace].append(response)
+
 
 class DebateAgent:
     """Flexible debating agent for any topic"""
     
-    def __init__(self, agent_id: str, model: str = "llama3.2"):
+    def __init__(self, agent_id: str, model: str = "llama3.2",
+                 client: Optional[ollama.AsyncClient] = None,
+                 cache: Optional[LLMCache] = None,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 options: Optional[Dict] = None,
+                 history_window: int = 6):
         self.agent_id = agent_id
         self.model = model
-        self.conversation_history = []
+        self._client = client or ollama.AsyncClient()
+        self._cache = cache
+        self._semantic_cache = semantic_cache
+        self.options = options  # Ollama sampling options, e.g. a fixed seed
+        self.conversation_history = []  # Full log; only the last history_window turns are sent
+        self.history_window = history_window
         self.initial_position = None  # Their main stance/answer
         self.position_label = None    # What to call it ("society", "solution", etc)
-        self.performance_metrics = {
+        self._system_msg = None       # Built once, sent verbatim as messages[0]
+        self.performance_metrics = self._new_metrics()
+        
+        # Calls made with another model (e.g. the tournament's voter_model) are tracked
+        # apart, so the agent's own averages only describe its own model
+        self.judge_model = None
+        self.judge_metrics = self._new_metrics()
+    
+    @staticmethod
+    def _new_metrics() -> Dict:
+        """Empty counters for one model's calls"""
+        return {
             "total_tokens": 0,
             "total_time": 0,
-            "response_times": [],
-            "avg_response_time": 0
+            "num_responses": 0,
+            "avg_response_time": 0,
+            "min_response_time": 0,
+            "max_response_time": 0,
+            "total_ttft": 0,  # Summed time to first streamed token
+            "cache_hits": 0,
+            "semantic_hits": 0
         }
     
     def _add_to_history(self, role: str, content: str):
@@ -39,19 +198,13 @@ class DebateAgent:
         """Build conversation context with history"""
         messages = []
         
-        # Set the agent's identity and position via system prompt
-        if self.initial_position and self.position_label:
-            messages.append({
-                "role": "system",
-                "content": f"You are a member of a round table discussing {self.position_label}. Your stance is: {self.initial_position}."
-            })
+        # The frozen system prompt always leads, so Ollama can reuse its KV cache
+        if self._system_msg:
+            messages.append(self._system_msg)
         
-        # Add conversation history
-        for entry in self.conversation_history:
-            messages.append({
-                "role": entry["role"], 
-                "content": entry["content"]
-            })
+        # Add the most recent turns (user + assistant pairs) of conversation history
+        if self.history_window > 0:
+            messages.extend(self.conversation_history[-2 * self.history_window:])
         
         # Add new prompt
         messages.append({
@@ -61,30 +214,91 @@ class DebateAgent:
         
         return messages
     
-    def generate_response(self, prompt: str, include_history: bool = True) -> str:
-        """Generate response with performance tracking"""
-        start_time = time.time()
-        
+    def _build_messages(self, prompt: str, include_history: bool) -> List[Dict]:
+        """Build the message list for a single call"""
         if include_history:
-            messages = self._get_context(prompt)
+            return self._get_context(prompt)
+        
+        # Without history the agent still needs its stance, once it has one
+        messages = [self._system_msg] if self._system_msg else []
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    @staticmethod
+    def _record_timing(metrics: Dict, elapsed_time: float, ttft: float):
+        """Track performance of a single model call in O(1)"""
+        metrics["num_responses"] += 1
+        metrics["total_ttft"] += ttft
+        metrics["total_time"] += elapsed_time
+        metrics["avg_response_time"] = metrics["total_time"] / metrics["num_responses"]
+        
+        if metrics["num_responses"] == 1:
+            metrics["min_response_time"] = metrics["max_response_time"] = elapsed_time
         else:
-            messages = [{"role": "user", "content": prompt}]
+            metrics["min_response_time"] = min(metrics["min_response_time"], elapsed_time)
+            metrics["max_response_time"] = max(metrics["max_response_time"], elapsed_time)
+    
+    async def achat(self, messages: List[Dict], semantic_namespace: Optional[str] = None,
+                    model: Optional[str] = None) -> str:
+        """Send a prebuilt message list without touching conversation history"""
+        model = model or self.model
+        if model == self.model:
+            metrics = self.performance_metrics
+        else:
+            metrics = self.judge_metrics
+            self.judge_model = model
+        
+        if self._cache is not None:
+            cached = self._cache.get(model, messages, self.options)
+            if cached is not None:
+                metrics["cache_hits"] += 1
+                return cached
+        
+        # Second tier: reuse the answer to a near-identical earlier prompt of the same kind.
+        # Only the final prompt is embedded; the shared stance would mask what differs.
+        query = None
+        if semantic_namespace is not None and self._semantic_cache is not None:
+            cached, query = await self._semantic_cache.lookup(
+                semantic_namespace, messages[-1]["content"]
+            )
+            if cached is not None:
+                metrics["semantic_hits"] += 1
+                return cached
         
-        response = ollama.chat(
-            model=self.model,
-            messages=messages
-        )
+        start_time = time.time()
         
-        # Track performance
-        elapsed_time = time.time() - start_time
-        self.performance_metrics["response_times"].append(elapsed_time)
-        self.performance_metrics["total_time"] += elapsed_time
-        self.performance_metrics["avg_response_time"] = (
-            sum(self.performance_metrics["response_times"]) / 
-            len(self.performance_metrics["response_times"])
+        # Stream to avoid Ollama stalling while it buffers the full generation
+        stream = await self._client.chat(
+            model=model,
+            messages=messages,
+            options=self.options,
+            stream=True
         )
         
-        content = response["message"]["content"]
+        chunks = []
+        ttft = None
+        async for chunk in stream:
+            if ttft is None:
+                ttft = time.time() - start_time
+            chunks.append(chunk["message"]["content"])
+        
+        self._record_timing(metrics, time.time() - start_time, ttft or 0)
+        
+        content = "".join(chunks)
+        if self._cache is not None:
+            self._cache.set(model, messages, content, self.options)
+        if query is not None:
+            self._semantic_cache.add(semantic_namespace, query, content)
+        
+        return content
+    
+    async def agenerate_response(self, prompt: str, include_history: bool = True,
+                                 semantic_namespace: Optional[str] = None) -> str:
+        """Generate response with performance tracking"""
+        content = await self.achat(
+            self._build_messages(prompt, include_history),
+            semantic_namespace=semantic_namespace
+        )
         
         # Add to history
         self._add_to_history("user", prompt)
@@ -92,25 +306,43 @@ class DebateAgent:
         
         return content
     
-    def set_initial_position(self, question: str, position_label: str = "position") -> str:
+    async def aset_initial_position(self, question: str, position_label: str = "position") -> str:
         """Generate and store initial position on any topic"""
-        response = self.generate_response(question, include_history=False)
+        response = await self.agenerate_response(question, include_history=False)
         self.initial_position = response
         self.position_label = position_label
+        self._system_msg = {
+            "role": "system",
+            "content": SYSTEM_TEMPLATE.format(label=position_label, position=response)
+        }
         return response
     
+    @staticmethod
+    def _summarize_metrics(metrics: Dict) -> Dict:
+        """Reportable view of one model's counters"""
+        return {
+            "total_responses": metrics["num_responses"],
+            "total_time": metrics["total_time"],
+            "avg_response_time": metrics["avg_response_time"],
+            "min_response_time": metrics["min_response_time"],
+            "max_response_time": metrics["max_response_time"],
+            "avg_ttft": metrics["total_ttft"] / metrics["num_responses"] if metrics["num_responses"] else 0,
+            "total_tokens": metrics["total_tokens"],
+            "cache_hits": metrics["cache_hits"],
+            "semantic_hits": metrics["semantic_hits"]
+        }
+    
     def get_metrics(self) -> Dict:
         """Return performance metrics for this agent"""
         return {
             "agent_id": self.agent_id,
             "model": self.model,
-            "total_responses": len(self.performance_metrics["response_times"]),
-            "total_time": self.performance_metrics["total_time"],
-            "avg_response_time": self.performance_metrics["avg_response_time"],
-            "min_response_time": min(self.performance_metrics["response_times"]) if self.performance_metrics["response_times"] else 0,
-            "max_response_time": max(self.performance_metrics["response_times"]) if self.performance_metrics["response_times"] else 0,
-            "total_tokens": self.performance_metrics["total_tokens"],
-            "conversation_length": len(self.conversation_history)
+            **self._summarize_metrics(self.performance_metrics),
+            "conversation_length": len(self.conversation_history),
+            "judge": {
+                "model": self.judge_model,
+                **self._summarize_metrics(self.judge_metrics)
+            } if self.judge_model else None
         }
 
 
@@ -118,24 +350,24 @@ class DebateAgent:
 
 # # Society debates
 # agent = GenericDebateAgent("agent_0")
-# agent.set_initial_position(
+# asyncio.run(agent.aset_initial_position(
 #     "Describe your ideal society in 200 words",
 #     position_label="ideal society"
-# )
+# ))
 
 # # Technology debates  
 # agent = GenericDebateAgent("agent_1")
-# agent.set_initial_position(
+# asyncio.run(agent.aset_initial_position(
 #     "Should AI development be regulated? Take a position and defend it.",
 #     position_label="stance on AI regulation"
-# )
+# ))
 
 # # Problem-solving debates
 # agent = GenericDebateAgent("agent_2")
-# agent.set_initial_position(
+# asyncio.run(agent.aset_initial_position(
 #     "How should we address climate change? Propose your top 3 solutions.",
 #     position_label="climate solutions"
-# )
+# ))
 
 
 class DebateTournament:
@@ -146,9 +378,22 @@ class DebateTournament:
                  models: Optional[List[str]] = None,
                  topic_question: str = None,
                  position_label: str = "position",
-                 output_dir: str = "debate_results"):
+                 output_dir: str = "debate_results",
+                 concurrency: int = 4,
+                 enable_cache: bool = True,
+                 semantic_cache: bool = False,
+                 embedding_model: str = "nomic-embed-text",
+                 judge_window: int = 0,
+                 host: Optional[str] = None,
+                 timeout: Optional[float] = None,
+                 history_window: int = 6,
+                 debater_model: Optional[str] = None,
+                 voter_model: Optional[str] = None):
         
         self.num_agents = num_agents
+        self.voter_model = voter_model  # None = each voter judges with its own model
+        self.judge_window = judge_window  # Earlier debates a voter still sees; 0 = every vote is fresh
+        self.concurrency = concurrency  # Max in-flight requests (match OLLAMA_NUM_PARALLEL)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.position_label = position_label
@@ -158,14 +403,50 @@ class DebateTournament:
         
         # Initialize agents with specified models
         if models is None:
-            models = ["llama3.2"] * num_agents
+            models = [debater_model or "llama3.2"] * num_agents
         elif len(models) < num_agents:
             models = (models * (num_agents // len(models) + 1))[:num_agents]
         
+        # The pooled client's connections belong to the loop that opened them, so every
+        # phase, whether run alone or via run_tournament, runs on this one loop
+        self._loop = asyncio.new_event_loop()
+        
+        # One pooled client shared by every agent; httpx keeps connections alive between calls
+        self.client = ollama.AsyncClient(
+            host=host,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        )
+        
+        # Replaying cached responses is only sound if sampling is reproducible,
+        # so cached runs give each agent its own fixed seed
+        self._cache = LLMCache(self.output_dir / "llm_cache.sqlite") if enable_cache else None
+        
+        # Semantic caches are per agent and only used for first rebuttals:
+        # a hit reuses that agent's own rebuttal to a near-identical opponent position
         self.agents = {
-            f"agent_{i}": DebateAgent(f"agent_{i}", models[i])
+            f"agent_{i}": DebateAgent(
+                f"agent_{i}", models[i],
+                client=self.client,
+                cache=self._cache,
+                semantic_cache=SemanticCache(self.client, embedding_model) if semantic_cache else None,
+                options={"seed": i} if enable_cache else None,
+                history_window=history_window
+            )
             for i in range(num_agents)
         }
+        self._agent_list = list(self.agents.values())
+        
+        # Debate pairings as (a, b) indices into _agent_list, with a < b
+        self._pair_idx = np.array(
+            list(combinations(range(num_agents), 2)), dtype=np.int32
+        ).reshape(-1, 2)
+        
+        # Opens every judge session and is identical across voters, so the prefix stays cacheable
+        self._judge_system_msg = {
+            "role": "system",
+            "content": JUDGE_SYSTEM_TEMPLATE.format(label=self.position_label)
+        }
         
         # Storage for results
         self.positions = {}  # Renamed from societies
@@ -178,15 +459,32 @@ class DebateTournament:
             "phase_durations": {}
         }
     
+    def _run(self, coro):
+        """Run a coroutine to completion on the tournament's event loop"""
+        return self._loop.run_until_complete(coro)
+    
     def run_phase_1_positions(self):
         """Generate all initial positions with progress bar"""
+        self._run(self._arun_phase_1())
+    
+    async def _arun_phase_1(self):
+        """Generate all initial positions concurrently"""
         print(f"\n=== Phase 1: Generating Initial {self.position_label.title()}s ===")
         phase_start = time.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def generate(agent: DebateAgent) -> str:
+            async with semaphore:
+                return await agent.aset_initial_position(self.topic_question, self.position_label)
         
-        for agent_id, agent in tqdm(self.agents.items(), desc=f"Generating {self.position_label}s"):
-            position = agent.set_initial_position(self.topic_question, self.position_label)
-            self.positions[agent_id] = {
-                "agent_id": agent_id,
+        results = await tqdm_asyncio.gather(
+            *(generate(agent) for agent in self._agent_list),
+            desc=f"Generating {self.position_label}s"
+        )
+        
+        for agent, position in zip(self._agent_list, results):
+            self.positions[agent.agent_id] = {
+                "agent_id": agent.agent_id,
                 "position": position,
                 "model": agent.model,
                 "generated_at": datetime.now().isoformat()
@@ -195,14 +493,14 @@ class DebateTournament:
         self.tournament_metrics["phase_durations"]["positions"] = time.time() - phase_start
         
         # Save positions
-        with open(self.output_dir / "positions.json", "w") as f:
-            json.dump({
+        with open(self.output_dir / "positions.json", "wb") as f:
+            f.write(orjson.dumps({
                 "topic_question": self.topic_question,
                 "position_label": self.position_label,
                 "positions": self.positions
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
     
-    def run_debate(self, agent_a_id: str, agent_b_id: str) -> Dict:
+    async def arun_debate(self, agent_a_id: str, agent_b_id: str) -> Dict:
         """Run a streamlined debate between two agents"""
         agent_a = self.agents[agent_a_id]
         agent_b = self.agents[agent_b_id]
@@ -216,20 +514,23 @@ class DebateTournament:
         round_start = time.time()
         
         # Round 1: First rebuttals of initial positions
-        rebuttal_prompt_a = f"""Your opponent's {self.position_label} is:
-{agent_b.initial_position}
-
-Point out specific weaknesses, contradictions, or problems with their {self.position_label}.
-Be analytical and precise. Keep response under 150 words."""
-
-        rebuttal_prompt_b = f"""Your opponent's {self.position_label} is:
-{agent_a.initial_position}
-
-Point out specific weaknesses, contradictions, or problems with their {self.position_label}.
-Be analytical and precise. Keep response under 150 words."""
-
-        rebuttal_a = agent_a.generate_response(rebuttal_prompt_a)
-        rebuttal_b = agent_b.generate_response(rebuttal_prompt_b)
+        rebuttal_prompt_a = REBUTTAL_TEMPLATE.format(
+            label=self.position_label, position=agent_b.initial_position
+        )
+        rebuttal_prompt_b = REBUTTAL_TEMPLATE.format(
+            label=self.position_label, position=agent_a.initial_position
+        )
+        
+        # A's and B's turns within a round are independent, so run them together.
+        # Each prompt quotes the opponent's text inline, so no history is needed.
+        rebuttal_a, rebuttal_b = await asyncio.gather(
+            agent_a.agenerate_response(
+                rebuttal_prompt_a, include_history=False, semantic_namespace="rebuttal"
+            ),
+            agent_b.agenerate_response(
+                rebuttal_prompt_b, include_history=False, semantic_namespace="rebuttal"
+            )
+        )
         
         debate["rounds"].append({
             "type": "first_rebuttal",
@@ -238,20 +539,13 @@ Be analytical and precise. Keep response under 150 words."""
         })
         
         # Round 2: Counter-rebuttals (responding to the criticism)
-        counter_prompt_a = f"""Your opponent criticized your {self.position_label} by saying:
-{rebuttal_b}
-
-Address their criticisms directly and explain why your {self.position_label} still holds.
-Keep response under 150 words."""
-
-        counter_prompt_b = f"""Your opponent criticized your {self.position_label} by saying:
-{rebuttal_a}
-
-Address their criticisms directly and explain why your {self.position_label} still holds.
-Keep response under 150 words."""
-
-        counter_a = agent_a.generate_response(counter_prompt_a)
-        counter_b = agent_b.generate_response(counter_prompt_b)
+        counter_prompt_a = COUNTER_TEMPLATE.format(label=self.position_label, rebuttal=rebuttal_b)
+        counter_prompt_b = COUNTER_TEMPLATE.format(label=self.position_label, rebuttal=rebuttal_a)
+        
+        counter_a, counter_b = await asyncio.gather(
+            agent_a.agenerate_response(counter_prompt_a, include_history=False),
+            agent_b.agenerate_response(counter_prompt_b, include_history=False)
+        )
         
         debate["rounds"].append({
             "type": "counter_rebuttal",
@@ -265,62 +559,125 @@ Keep response under 150 words."""
     
     def run_phase_2_debates(self):
         """Run all debates with progress tracking"""
+        self._run(self._arun_phase_2())
+    
+    async def _arun_phase_2(self):
+        """Run all debates concurrently, never putting one agent in two debates at once"""
         print("\n=== Phase 2: Running Debates ===")
         phase_start = time.time()
         
-        debate_pairs = list(combinations(self.agents.keys(), 2))
+        # Agent history is not coroutine-safe, so each debate holds both agents' locks.
+        # Pair indices are ordered (a < b), so locks are always taken in order.
+        agent_locks = {agent_id: asyncio.Lock() for agent_id in self.agents}
+        # Each debate has two requests in flight at a time
+        semaphore = asyncio.Semaphore(max(1, self.concurrency // 2))
         
-        for agent_a_id, agent_b_id in tqdm(debate_pairs, desc="Running debates"):
-            debate = self.run_debate(agent_a_id, agent_b_id)
-            self.debates.append(debate)
+        # Debates are appended as they finish, so a crash keeps everything completed so far
+        with open(self.output_dir / "debates.jsonl", "wb") as debates_file:
+            
+            async def debate_task(agent_a_id: str, agent_b_id: str) -> Dict:
+                async with agent_locks[agent_a_id], agent_locks[agent_b_id]:
+                    async with semaphore:
+                        debate = await self.arun_debate(agent_a_id, agent_b_id)
+                # Write in a worker thread so disk I/O overlaps with other debates' requests
+                await asyncio.to_thread(self._append_jsonl, debates_file, debate)
+                return debate
+            
+            self.debates = await tqdm_asyncio.gather(
+                *(debate_task(self._agent_list[a].agent_id, self._agent_list[b].agent_id)
+                  for a, b in self._pair_idx),
+                desc="Running debates"
+            )
         
         self.tournament_metrics["phase_durations"]["debates"] = time.time() - phase_start
-        
-        # Save debates
-        with open(self.output_dir / "debates.json", "w") as f:
-            json.dump(self.debates, f, indent=2)
+    
+    @staticmethod
+    def _append_jsonl(f, record: Dict):
+        """Append one record as a JSON line and flush it to disk"""
+        f.write(orjson.dumps(record) + b"\n")
+        f.flush()
     
     def run_phase_3_voting(self):
         """Voting phase with progress tracking"""
+        self._run(self._arun_phase_3())
+    
+    async def _arun_phase_3(self):
+        """Collect votes on every debate, stopping once its winner is decided"""
         print("\n=== Phase 3: Voting on Debates ===")
         phase_start = time.time()
-        
-        for i, debate in enumerate(tqdm(self.debates, desc="Collecting votes")):
-            debate_votes = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        # Every voter sees the same text for a debate, so build it once
+        debate_summaries = [
+            self._format_debate_for_voting(debate, i)
+            for i, debate in enumerate(self.debates)
+        ]
+        
+        # Each voter keeps one judge session across debates. Within a session the prefix
+        # only grows, so Ollama re-prefills just the newest debate; restarting after
+        # judge_window debates keeps context from growing O(D^2).
+        # Sessions are not coroutine-safe, so a voter judges one debate at a time.
+        sessions = {agent_id: [self._judge_system_msg] for agent_id in self.agents}
+        voter_locks = {agent_id: asyncio.Lock() for agent_id in self.agents}
+        
+        async def judge(agent_id: str, debate_index: int) -> str:
+            async with voter_locks[agent_id], semaphore:
+                session = sessions[agent_id]
+                session.append({"role": "user", "content": debate_summaries[debate_index]})
+                
+                vote_response = await self.agents[agent_id].achat(session, model=self.voter_model)
+                if len(session) // 2 > self.judge_window:
+                    sessions[agent_id] = [self._judge_system_msg]
+                else:
+                    session.append({"role": "assistant", "content": vote_response})
+                
+                return vote_response
+        
+        async def poll_debate(debate_index: int, debate: Dict) -> Dict:
             participants = debate['participants']
+            voters = [agent_id for agent_id in self.agents if agent_id not in participants]
+            debate_votes = []
+            counts = Counter()
             
-            # Get votes from non-participants
-            for agent_id, agent in self.agents.items():
-                if agent_id not in participants:
-                    debate_summary = self._format_debate_for_voting(debate, i)
-                    vote_prompt = f"""{debate_summary}
-
-Based on the strength of arguments and rebuttals, which {self.position_label} is more convincing?
-Reply with only 'A' or 'B' and one sentence explaining why."""
-                    
-                    vote_response = agent.generate_response(vote_prompt)
-                    
-                    # Parse vote
-                    vote = "A" if "A" in vote_response[:10] else "B"
-                    winner_id = participants[0] if vote == "A" else participants[1]
-                    
-                    debate_votes.append({
-                        "voter_id": agent_id,
-                        "winner_id": winner_id,
-                        "reasoning": vote_response,
-                        "vote": vote
-                    })
+            for polled, agent_id in enumerate(voters, start=1):
+                vote_response = await judge(agent_id, debate_index)
+                
+                vote = parse_vote(vote_response)
+                winner_id = participants[0] if vote == "A" else participants[1]
+                counts[winner_id] += 1
+                
+                debate_votes.append({
+                    "voter_id": agent_id,
+                    "winner_id": winner_id,
+                    "reasoning": vote_response,
+                    "vote": vote
+                })
+                
+                # Stop once the remaining voters can no longer change the winner
+                top_two = counts.most_common(2)
+                lead = top_two[0][1] - (top_two[1][1] if len(top_two) > 1 else 0)
+                if lead > len(voters) - polled:
+                    break
             
-            self.votes[f"debate_{i}"] = {
+            return {
                 "participants": participants,
-                "votes": debate_votes
+                "votes": debate_votes,
+                "not_polled": voters[len(debate_votes):]
             }
         
+        results = await tqdm_asyncio.gather(
+            *(poll_debate(i, debate) for i, debate in enumerate(self.debates)),
+            desc="Collecting votes"
+        )
+        
+        for i, result in enumerate(results):
+            self.votes[f"debate_{i}"] = result
+        
         self.tournament_metrics["phase_durations"]["voting"] = time.time() - phase_start
         
         # Save votes
-        with open(self.output_dir / "votes.json", "w") as f:
-            json.dump(self.votes, f, indent=2)
+        with open(self.output_dir / "votes.json", "wb") as f:
+            f.write(orjson.dumps(self.votes, option=orjson.OPT_INDENT_2))
     
     def _format_debate_for_voting(self, debate: Dict, debate_index: int) -> str:
         """Format debate for viewing by voters"""
@@ -331,21 +688,12 @@ Reply with only 'A' or 'B' and one sentence explaining why."""
         pos_a = self.positions[p[0]]["position"]
         pos_b = self.positions[p[1]]["position"]
         
-        return f"""Judge this debate about {self.position_label}s.
-
-=== Initial Positions ===
-Position A ({p[0]}): {pos_a}
-
-Position B ({p[1]}): {pos_b}
-
-=== Debate ===
-A's criticism of B: {r[0][p[0]]}
-
-B's criticism of A: {r[0][p[1]]}
-
-A's defense: {r[1][p[0]]}
-
-B's defense: {r[1][p[1]]}"""
+        return DEBATE_SUMMARY_TEMPLATE.format(
+            id_a=p[0], id_b=p[1],
+            position_a=pos_a, position_b=pos_b,
+            rebuttal_a=r[0][p[0]], rebuttal_b=r[0][p[1]],
+            counter_a=r[1][p[0]], counter_b=r[1][p[1]]
+        )
     
     def calculate_results(self):
         """Calculate final results and performance metrics"""
@@ -356,13 +704,8 @@ B's defense: {r[1][p[1]]}"""
         
         for debate_id, vote_data in self.votes.items():
             votes = vote_data['votes']
-            winner_count = {}
-            
-            for vote in votes:
-                winner_id = vote['winner_id']
-                winner_count[winner_id] = winner_count.get(winner_id, 0) + 1
             
-            debate_winner = max(winner_count, key=winner_count.get)
+            debate_winner = Counter(vote['winner_id'] for vote in votes).most_common(1)[0][0]
             win_counts[debate_winner] += 1
         
         rankings = sorted(win_counts.items(), key=lambda x: x[1], reverse=True)
@@ -379,6 +722,7 @@ B's defense: {r[1][p[1]]}"""
                 "num_agents": self.num_agents,
                 "topic_question": self.topic_question,
                 "position_label": self.position_label,
+                "voter_model": self.voter_model,
                 "timestamp": datetime.now().isoformat(),
                 "duration": self.tournament_metrics
             },
@@ -387,8 +731,8 @@ B's defense: {r[1][p[1]]}"""
             "agent_performance": agent_metrics
         }
         
-        with open(self.output_dir / "tournament_results.json", "w") as f:
-            json.dump(results, f, indent=2)
+        with open(self.output_dir / "tournament_results.json", "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         
         # Print summary
         print("\n=== Final Rankings ===")
@@ -399,6 +743,12 @@ B's defense: {r[1][p[1]]}"""
         
         print(f"\nTotal tournament duration: {self.tournament_metrics['total_duration']:.2f} seconds")
     
+    async def _arun_phases(self):
+        """Run the three tournament phases in order"""
+        await self._arun_phase_1()
+        await self._arun_phase_2()
+        await self._arun_phase_3()
+    
     def run_tournament(self):
         """Run complete tournament"""
         print(f"=== Flexible Debate Tournament ===")
@@ -408,10 +758,7 @@ B's defense: {r[1][p[1]]}"""
         
         self.tournament_metrics["start_time"] = time.time()
         
-        # Run phases
-        self.run_phase_1_positions()
-        self.run_phase_2_debates()
-        self.run_phase_3_voting()
+        self._run(self._arun_phases())
         
         self.tournament_metrics["end_time"] = time.time()
         self.tournament_metrics["total_duration"] = (